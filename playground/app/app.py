@@ -15,7 +15,9 @@
 import os
 from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
 import streamlit.components.v1 as st_components
 from dotenv import load_dotenv
@@ -25,7 +27,7 @@ from export_utils import (
     export_conversation_markdown,
     get_export_filename,
 )
-from translations import get_locale, set_locale, t
+from translations import get_locale, preload, set_locale
 
 load_dotenv()
 
@@ -47,6 +49,21 @@ _turnstile_component = st_components.declare_component(
 _assets_dir = Path(__file__).parent / "assets"
 _LOGO_SVG = (_assets_dir / "artek-vertical-current.svg").read_text(encoding="utf-8")
 
+
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """Process-wide pooled session so follow-up turns reuse the TLS connection.
+
+    Streamlit re-executes this script on every interaction, so a plain
+    module-level Session would be rebuilt per rerun.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 ALLOWED_MODELS = [
     "@cf/meta/llama-3.3-70b-instruct-fp8-fast",
     "@cf/meta/llama-3.1-8b-instruct",
@@ -60,11 +77,11 @@ ALLOWED_MODELS = [
 def render_sources(source_items: list, meta: dict) -> None:
     """Render sources block with expandable content for each chunk."""
     with st.chat_message("assistant", avatar="🔍"):
-        st.markdown(f"**{t('sources.title')}** ({len(source_items)})")
+        st.markdown(f"**{T.sources_title}** ({len(source_items)})")
 
         for src in source_items:
             score_pct = src["score"] * 100
-            label = f"`{src['filename']}` ({t('sources.score')}: {score_pct:.1f}%)"
+            label = f"`{src['filename']}` ({T.sources_score}: {score_pct:.1f}%)"
 
             content = src.get("content", "")
             if content:
@@ -75,18 +92,30 @@ def render_sources(source_items: list, meta: dict) -> None:
 
         if meta:
             st.caption(
-                f"{t('metadata.searchQuery')}: {meta.get('search_query', '-')} · "
-                f"{t('metadata.duration')}: {meta.get('duration_ms', 0)}ms"
+                f"{T.metadata_searchQuery}: {meta.get('search_query', '-')} · "
+                f"{T.metadata_duration}: {meta.get('duration_ms', 0)}ms"
             )
 
 
+def add_message(message: dict) -> None:
+    """Append to the chat history and its request-shaped mirror."""
+    st.session_state["messages"].append(message)
+    st.session_state["payload_messages"].append(
+        {"role": message["role"], "content": message["content"]}
+    )
+    st.session_state.pop("export_cache", None)
+
+
 # ---------------------------------------------------------------------------
 # Page Config
 # ---------------------------------------------------------------------------
 
+# UI strings for this rerun, resolved once: "sidebar.model" → T.sidebar_model
+T = preload(get_locale())
+
 st.set_page_config(
-    page_title=t("app.title"),
-    page_icon=t("app.pageIcon"),
+    page_title=T.app_title,
+    page_icon=T.app_pageIcon,
     layout="wide",
     initial_sidebar_state="collapsed",
 )
@@ -97,6 +126,10 @@ st.set_page_config(
 
 if "messages" not in st.session_state:
     st.session_state["messages"] = []
+# Request-shaped copy of messages ({role, content} only), kept in lockstep
+# via add_message() so each turn appends instead of rebuilding the list.
+if "payload_messages" not in st.session_state:
+    st.session_state["payload_messages"] = []
 if "pending" not in st.session_state:
     st.session_state["pending"] = False
 if "last_debug" not in st.session_state:
@@ -109,33 +142,51 @@ if "turnstile_reset" not in st.session_state:
 # Save Dialog
 # ---------------------------------------------------------------------------
 
-@st.dialog(t("export.title"))
+def _render_exports(messages: list, locale: str) -> tuple[str, str]:
+    """Render Markdown + JSON exports once per conversation state.
+
+    Memoized in session_state (not st.cache_data) so one user's export can
+    never be served to another session. Messages are append-only and
+    add_message() drops the memo, so the key never reads their contents.
+    """
+    key = (locale, len(messages), id(messages[-1]) if messages else None)
+    cached = st.session_state.get("export_cache")
+    if cached is None or cached[0] != key:
+        cached = (
+            key,
+            export_conversation_markdown(messages, locale=locale),
+            export_conversation_json(messages),
+        )
+        st.session_state["export_cache"] = cached
+    return cached[1], cached[2]
+
+
+@st.dialog(T.export_title)
 def save_dialog():
     """Export conversation as Markdown or JSON."""
+    md_content, json_content = _render_exports(
+        st.session_state["messages"], get_locale()
+    )
     export_cols = st.columns(2)
 
     with export_cols[0]:
-        md_content = export_conversation_markdown(
-            st.session_state["messages"], locale=get_locale()
-        )
         st.download_button(
-            label=t("export.markdown"),
+            label=T.export_markdown,
             data=md_content,
             file_name=get_export_filename("md"),
             mime="text/markdown",
             use_container_width=True,
-            help=t("export.markdownTooltip"),
+            help=T.export_markdownTooltip,
         )
 
     with export_cols[1]:
-        json_content = export_conversation_json(st.session_state["messages"])
         st.download_button(
-            label=t("export.json"),
+            label=T.export_json,
             data=json_content,
             file_name=get_export_filename("json"),
             mime="application/json",
             use_container_width=True,
-            help=t("export.jsonTooltip"),
+            help=T.export_jsonTooltip,
         )
 
 # ---------------------------------------------------------------------------
@@ -145,7 +196,7 @@ def save_dialog():
 header_cols = st.columns([6, 1, 1, 1, 1])
 
 with header_cols[0]:
-    st.title(t("app.title"))
+    st.title(T.app_title)
 
 with header_cols[1]:
     if st.button(
@@ -180,6 +231,8 @@ with header_cols[4]:
         disabled=st.session_state["pending"] or not st.session_state["messages"],
     ):
         st.session_state["messages"] = []
+        st.session_state["payload_messages"] = []
+        st.session_state.pop("export_cache", None)
         st.rerun()
 
 # ---------------------------------------------------------------------------
@@ -189,20 +242,20 @@ with header_cols[4]:
 with st.sidebar:
     st.markdown(f'<div style="display:flex;justify-content:center;margin-bottom:20px;pointer-events:none">{_LOGO_SVG}</div>', unsafe_allow_html=True)
 
-    st.header(t("sidebar.searchOptions"))
+    st.header(T.sidebar_searchOptions)
 
-    so_model = st.selectbox(t("sidebar.model"), options=ALLOWED_MODELS, index=0)
+    so_model = st.selectbox(T.sidebar_model, options=ALLOWED_MODELS, index=0)
 
-    so_rewrite_query = st.toggle(t("sidebar.rewriteQuery"), value=True)
+    so_rewrite_query = st.toggle(T.sidebar_rewriteQuery, value=True)
 
-    so_reranking = st.toggle(t("sidebar.reRanking"), value=True)
+    so_reranking = st.toggle(T.sidebar_reRanking, value=True)
 
     so_max_results = st.slider(
-        t("sidebar.maxResults"), min_value=1, max_value=50, value=20
+        T.sidebar_maxResults, min_value=1, max_value=50, value=20
     )
 
     so_score_threshold = st.slider(
-        t("sidebar.scoreThreshold"),
+        T.sidebar_scoreThreshold,
         min_value=0.0,
         max_value=1.0,
         value=0.4,
@@ -212,11 +265,11 @@ with st.sidebar:
     st.divider()
 
     st.markdown(
-        f"[{t('sidebar.cta')}](https://www.artek.tc)"
+        f"[{T.sidebar_cta}](https://www.artek.tc)"
     )
 
-    st.caption(f"© 2026 {t('sidebar.copyright')}")
-    st.caption(f"© 2026 {t('sidebar.copyrightCompany')}")
+    st.caption(f"© 2026 {T.sidebar_copyright}")
+    st.caption(f"© 2026 {T.sidebar_copyrightCompany}")
     st.markdown(
         "[![GitHub](https://img.shields.io/badge/GitHub-181717?logo=github&logoColor=white)]"
         "(https://github.com/ARAS-Workspace/eu-ai-act-rag)"
@@ -229,8 +282,8 @@ with st.sidebar:
 
 if not st.session_state["messages"]:
     with st.chat_message("assistant"):
-        st.markdown(t("chat.welcome"))
-        st.markdown(t("chat.examples"))
+        st.markdown(T.chat_welcome)
+        st.markdown(T.chat_examples)
 
 # ---------------------------------------------------------------------------
 # Chat History
@@ -247,34 +300,42 @@ for msg in st.session_state["messages"]:
 # Turnstile Widget
 # ---------------------------------------------------------------------------
 
-if TURNSTILE_ENABLED:
+@st.fragment
+def turnstile_widget() -> None:
+    """Render Turnstile as a fragment.
+
+    The widget re-solves after every reset and reports its token through
+    setComponentValue; inside a fragment that only reruns this block
+    instead of the whole script.
+    """
     st.session_state["turnstile_token"] = _turnstile_component(
         reset_count=st.session_state["turnstile_reset"],
         key="turnstile",
         default=None,
     )
 
+
+if TURNSTILE_ENABLED:
+    turnstile_widget()
+
 # ---------------------------------------------------------------------------
 # Chat Input
 # ---------------------------------------------------------------------------
 
 if prompt := st.chat_input(
-    t("chat.placeholder"), disabled=st.session_state["pending"]
+    T.chat_placeholder, disabled=st.session_state["pending"]
 ):
-    st.session_state["messages"].append({"role": "user", "content": prompt})
+    add_message({"role": "user", "content": prompt})
     st.session_state["pending"] = True
     st.rerun()
 
 if st.session_state["pending"]:
     with st.chat_message("assistant"):
         # noinspection PyTypeChecker
-        with st.spinner(t("chat.thinking")):
+        with st.spinner(T.chat_thinking):
             try:
                 payload = {
-                    "messages": [
-                        {"role": m["role"], "content": m["content"]}
-                        for m in st.session_state["messages"]
-                    ],
+                    "messages": st.session_state["payload_messages"],
                     "locale": get_locale(),
                     "searchOptions": {
                         "model": so_model,
@@ -287,13 +348,16 @@ if st.session_state["pending"]:
 
                 url = f"{WORKER_URL}/api/v1/chat/completions"
 
-                headers = {}
+                headers = {"Content-Type": "application/json"}
                 if TURNSTILE_ENABLED:
                     token = st.session_state.get("turnstile_token")
                     if token:
                         headers["X-Turnstile-Token"] = token
 
-                resp = requests.post(url, json=payload, headers=headers, timeout=60)
+                body = orjson.dumps(payload)
+                resp = _http_session().post(
+                    url, data=body, headers=headers, timeout=60
+                )
 
                 if TURNSTILE_ENABLED:
                     st.session_state["turnstile_reset"] += 1
@@ -310,19 +374,19 @@ if st.session_state["pending"]:
                     "content_type": resp.headers.get("content-type", "N/A"),
                     "size": len(resp.content),
                     "elapsed": resp.elapsed.total_seconds(),
-                    "payload": payload,
+                    "payload": body.decode("utf-8"),
                     "response": resp_body,
                 }
 
                 if resp.status_code == 200:
                     data = resp.json()
                     response_text = data.get(
-                        "response", t("errors.emptyResponse")
+                        "response", T.errors_emptyResponse
                     )
                     sources = data.get("sources", [])
                     metadata = data.get("metadata", {})
 
-                    st.session_state["messages"].append(
+                    add_message(
                         {
                             "role": "assistant",
                             "content": response_text,
@@ -331,8 +395,8 @@ if st.session_state["pending"]:
                         }
                     )
                 elif resp.status_code == 403:
-                    st.session_state["messages"].append(
-                        {"role": "assistant", "content": t("errors.turnstileFailed")}
+                    add_message(
+                        {"role": "assistant", "content": T.errors_turnstileFailed}
                     )
                 else:
                     error_data = (
@@ -344,9 +408,9 @@ if st.session_state["pending"]:
                     )
                     error_msg = error_data.get("error", {}).get(
                         "message",
-                        f"{t('errors.requestFailed')}: {resp.status_code}",
+                        f"{T.errors_requestFailed}: {resp.status_code}",
                     )
-                    st.session_state["messages"].append(
+                    add_message(
                         {"role": "assistant", "content": error_msg}
                     )
 
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: MIT
+#
+#  █████╗ ██████╗  █████╗ ███████╗
+# ██╔══██╗██╔══██╗██╔══██╗██╔════╝
+# ███████║██████╔╝███████║███████╗
+# ██╔══██║██╔══██╗██╔══██║╚════██║
+# ██║  ██║██║  ██║██║  ██║███████║
+# ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+# Copyright (C) 2026 Riza Emre ARAS <r.emrearas@proton.me>
+#
+# Licensed under the MIT License.
+# See LICENSE and THIRD_PARTY_LICENSES for details.
+"""Compile locales/*.json into pre-flattened Python modules.
+
+Writes locales/_<locale>.py with ``STRINGS = {"app.title": ..., ...}`` so
+load_translations can import the strings from cached bytecode instead of
+parsing JSON on every cold start. Run at image build time (see Dockerfile);
+the generated modules are not committed, and without them the JSON files
+are read directly.
+
+Usage: python compile_locales.py
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from translations import _flatten
+
+log = logging.getLogger(__name__)
+
+LOCALES_DIR = Path(__file__).parent / "locales"
+
+
+def compile_locale(source: Path) -> Path:
+    strings = dict(_flatten(json.loads(source.read_bytes())))
+    lines = [
+        f"# Generated by compile_locales.py from {source.name} — do not edit.",
+        "STRINGS = {",
+        *(f"    {key!r}: {value!r}," for key, value in strings.items()),
+        "}",
+        "",
+    ]
+    target = source.with_name(f"_{source.stem}.py")
+    target.write_text("\n".join(lines), encoding="utf-8")
+    return target
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    for path in sorted(LOCALES_DIR.glob("*.json")):
+        log.info("%s -> %s", path.name, compile_locale(path).name)
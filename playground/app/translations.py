@@ -12,15 +12,71 @@
 # See LICENSE and THIRD_PARTY_LICENSES for details.
 """Translation helper — JSON-based i18n with dot-notation key access."""
 
-import json
+import importlib
 import os
+import sys
+from types import SimpleNamespace
+
 import streamlit as st
 
+try:
+    import orjson
+
+    def _parse(raw: bytes) -> dict:
+        return orjson.loads(raw)
+except ImportError:  # stdlib fallback
+    import json
+
+    def _parse(raw: bytes) -> dict:
+        return json.loads(raw)
+
+
+# Flattened strings per locale, filled on first use. Imported modules
+# survive Streamlit reruns, so t() skips the cache_resource lookup.
+_FLAT: dict[str, dict[str, str]] = {}
+
+
+def _flatten(tree: dict, prefix: str = ""):
+    """Yield ("sources.title", "Sources") pairs from nested locale dicts.
+
+    Keys are interned so lookups with the same literal hit the identity
+    fast path instead of a full string compare.
+    """
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}.")
+        elif isinstance(value, str):
+            yield sys.intern(f"{prefix}{key}"), value
+
+
+@st.cache_resource(show_spinner=False)
+def load_translations(locale: str) -> dict[str, str]:
+    """Load a locale file once per process, pre-flattened to dotted keys.
+
+    Prefers the locales/_<locale>.py module emitted by compile_locales.py
+    (imported from bytecode, no parsing); falls back to the JSON source.
+    Cached as a shared resource: every session reads the same dict.
+    """
+    try:
+        strings = importlib.import_module(f"locales._{locale}").STRINGS
+        return {sys.intern(key): value for key, value in strings.items()}
+    except ModuleNotFoundError:
+        pass
 
-def load_translations(locale: str) -> dict:
     path = os.path.join(os.path.dirname(__file__), "locales", f"{locale}.json")
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return dict(_flatten(_parse(f.read())))
+
+
+@st.cache_resource(show_spinner=False)
+def preload(locale: str) -> SimpleNamespace:
+    """Expose every string as an attribute: "sidebar.model" → ``T.sidebar_model``."""
+    return SimpleNamespace(
+        **{
+            sys.intern(key.replace(".", "_")): value
+            for key, value in load_translations(locale).items()
+        }
+    )
 
 
 def get_locale() -> str:
@@ -33,16 +89,7 @@ def set_locale(locale: str) -> None:
 
 def t(key: str) -> str:
     locale = get_locale()
-
-    if "translations" not in st.session_state or st.session_state.get("_translations_locale") != locale:
-        st.session_state["translations"] = load_translations(locale)
-        st.session_state["_translations_locale"] = locale
-
-    keys = key.split(".")
-    value = st.session_state["translations"]
-    for k in keys:
-        if isinstance(value, dict):
-            value = value.get(k, key)
-        else:
-            return key
-    return value if isinstance(value, str) else key
+    strings = _FLAT.get(locale)
+    if strings is None:
+        strings = _FLAT[locale] = load_translations(locale)
+    return strings.get(key, key)
@@ -37,7 +37,7 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.config import load_config
+from src.config import ConfigError, load_config
 from src.logger import get_logger
 from src.pipeline import run_pipeline
 
@@ -58,13 +58,11 @@ def main() -> int:
     args = parser.parse_args()
 
     workflow = args.workflow.resolve()
-    if not workflow.exists():
-        log.error("Workflow file not found: %s", workflow)
-        return 1
 
-    cfg_result = load_config(workflow)
-    if not cfg_result.ok:
-        log.error(cfg_result.error)
+    try:
+        config = load_config(workflow)
+    except ConfigError as exc:
+        log.error(exc)
         return 1
 
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
@@ -74,7 +72,7 @@ def main() -> int:
     log.info("Workflow: %s", workflow.name)
     log.info("Output: %s", output_dir)
 
-    result = run_pipeline(cfg_result.data, output_dir=output_dir)
+    result = run_pipeline(config, output_dir=output_dir)
     if not result.ok:
         log.error("Pipeline failed: %s", result.error)
         return 1
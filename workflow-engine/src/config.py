@@ -18,13 +18,34 @@ Pure loader — no domain logic. YAML structure IS the workflow contract.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from src.result import Fail, Ok, Result
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available — pure-Python fallback
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+# Parsed configs are pickled here, keyed on (path, mtime, size) of the YAML
+# plus a fingerprint of this module, so editing the dataclasses or builders
+# below invalidates old entries. An entry that fails to unpickle is a miss.
+_CACHE_DIR = Path.home() / ".cache" / "eu-ai-act-rag"
+
+
+class ConfigError(Exception):
+    """Workflow file missing, unparsable, or structurally incomplete."""
+
+    def __init__(self, message: str, context: Any = None) -> None:
+        super().__init__(message)
+        self.context = context
 
 
 # ── SPARQL ─────────────────────────────────────────────────────
@@ -43,7 +64,7 @@ class SparqlStep:
 class SparqlConfig:
     endpoint: str
     timeout: int
-    steps: list[SparqlStep]
+    steps: tuple[SparqlStep, ...]
 
 
 # ── Source ─────────────────────────────────────────────────────
@@ -76,13 +97,14 @@ class FetchConfig:
 
 @dataclass(frozen=True, slots=True)
 class NormalizeRule:
+    """Literal substring replacement — ``find`` is not a regular expression."""
     find: str
     replace: str
 
 
 @dataclass(frozen=True, slots=True)
 class PostprocessConfig:
-    normalize: list[NormalizeRule]
+    normalize: tuple[NormalizeRule, ...]
 
 
 # ── Validation ────────────────────────────────────────────────
@@ -127,8 +149,8 @@ class PipelineConfig:
 
 # ── Loader ─────────────────────────────────────────────────────
 
-def _build_steps(raw_steps: list[dict[str, Any]]) -> list[SparqlStep]:
-    return [
+def _build_steps(raw_steps: list[dict[str, Any]]) -> tuple[SparqlStep, ...]:
+    return tuple(
         SparqlStep(
             name=s["name"],
             description=s["description"],
@@ -137,7 +159,7 @@ def _build_steps(raw_steps: list[dict[str, Any]]) -> list[SparqlStep]:
             required=s.get("required", False),
         )
         for s in raw_steps
-    ]
+    )
 
 
 def _build_validation(raw: dict[str, Any]) -> ValidationConfig:
@@ -152,10 +174,10 @@ def _build_validation(raw: dict[str, Any]) -> ValidationConfig:
 
 
 def _build_postprocess(raw: dict[str, Any]) -> PostprocessConfig:
-    rules = [
+    rules = tuple(
         NormalizeRule(find=r["find"], replace=r["replace"])
         for r in raw.get("normalize", [])
-    ]
+    )
     return PostprocessConfig(normalize=rules)
 
 
@@ -171,15 +193,78 @@ def _build_sections(raw: dict[str, Any]) -> dict[str, SectionDef]:
     }
 
 
-def load_config(path: Path) -> Result[PipelineConfig]:
-    """Load data.yaml into PipelineConfig. No validation beyond structure."""
-    if not path.exists():
-        return Fail(error=f"Config file not found: {path}")
+@lru_cache(maxsize=1)
+def _schema_digest() -> str:
+    """Fingerprint of this module's source (or, without source, its dataclass fields)."""
+    try:
+        source = Path(__file__).read_bytes()
+    except OSError:  # bytecode-only install
+        source = repr([
+            (name, [f.name for f in fields(obj)])
+            for name, obj in sorted(globals().items())
+            if isinstance(obj, type) and is_dataclass(obj)
+        ]).encode("utf-8")
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def _cache_path(path: Path, st: os.stat_result) -> Path:
+    """Cache file for a given YAML identity — changes whenever mtime/size do."""
+    key = f"{_schema_digest()}:{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return _CACHE_DIR / f"config-{digest}.pkl"
+
+
+def _read_cache(cache_file: Path) -> PipelineConfig | None:
+    """Return the cached config, or None on miss / unreadable entry."""
+    try:
+        with cache_file.open("rb") as f:
+            config = pickle.load(f)  # noqa: S301 — written by _write_cache only
+    except Exception:  # noqa: BLE001 — stale or corrupt entry: reparse the YAML
+        return None
+    return config if isinstance(config, PipelineConfig) else None
+
+
+def _write_cache(cache_file: Path, config: PipelineConfig) -> None:
+    """Atomically persist config. Cache failures never fail the load."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, pickle.PickleError):
+        pass
+
+
+def load_config(path: Path) -> PipelineConfig:
+    """Load data.yaml into PipelineConfig. No validation beyond structure.
+
+    Parsed configs are cached on disk and reused while the file is unchanged.
+    Raises ConfigError — loading happens once at startup, so the happy path
+    carries no Result wrapper.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise ConfigError(f"Config file not found: {path}") from None
+
+    cache_file = _cache_path(path, st)
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        return cached
 
     try:
-        raw: dict[str, Any] = yaml.safe_load(path.read_text(encoding="utf-8"))
+        # libyaml pulls the stream through its own buffer — no full-file copy
+        with path.open("rb") as f:
+            raw: dict[str, Any] = yaml.load(f, Loader=_Loader)  # noqa: S506
+    except FileNotFoundError:
+        raise ConfigError(f"Config file not found: {path}") from None
     except yaml.YAMLError as exc:
-        return Fail(error=f"YAML parse error: {exc}", context=str(path))
+        raise ConfigError(f"YAML parse error: {exc}", context=str(path)) from exc
 
     try:
         retry = raw["fetch"]["retry"]
@@ -208,6 +293,7 @@ def load_config(path: Path) -> Result[PipelineConfig]:
             ),
         )
     except (KeyError, TypeError) as exc:
-        return Fail(error=f"Config structure error: {exc}", context=str(path))
+        raise ConfigError(f"Config structure error: {exc}", context=str(path)) from exc
 
-    return Ok(data=config)
\ No newline at end of file
+    _write_cache(cache_file, config)
+    return config
\ No newline at end of file
@@ -19,12 +19,20 @@ Templates come from data.yaml corpus config.
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+
 from src.config import CorpusConfig, PostprocessConfig, SectionDef
 from src.logger import PipelineSummary, get_logger
 from src.parser import Article, ParsedDocument
@@ -32,6 +40,84 @@ from src.result import Ok, Result
 
 log = get_logger(__name__)
 
+_WRITE_WORKERS = 8
+
+_FIELD_RE = re.compile(r"\{([A-Za-z_]\w*)}")
+_CTX_RE = re.compile(r"\{\{context\.(\w+)\.(\w+)}}")
+
+# ── Frontmatter emitter ───────────────────────────────────────
+# Strings matching _PLAIN_RE are emitted as plain YAML scalars exactly as
+# yaml.dump would; anything else falls back to the real dumper. U+2028 and
+# U+2029 are YAML line breaks, so they are left out of the plain ranges.
+
+_WORD = r"[A-Za-z0-9_./()\-\u00a0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd]"
+_PLAIN_RE = re.compile(
+    rf"[A-Za-z_/\u00a0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd]{_WORD}*"
+    rf"(?:(?: |:(?=\S)){_WORD}+)*",
+)
+_INT_RE = re.compile(r"0|[1-9][0-9]*|0[0-7]+")
+_RESERVED = frozenset({
+    "yes", "no", "true", "false", "on", "off", "null",
+})
+_LIST_KEYS = ("cross_references", "eurovoc")
+_WIDTH = 80
+
+
+def _plain(value: str, column: int) -> str | None:
+    """Return ``value`` as a YAML scalar, or None if it needs the dumper."""
+    if _INT_RE.fullmatch(value):
+        return f"'{value}'"
+    if (
+        _PLAIN_RE.fullmatch(value)
+        and value.lower() not in _RESERVED
+        and column + len(value) <= _WIDTH
+    ):
+        return value
+    return None
+
+
+def _emit_entry(key: str, value: Any, indent: str = "") -> str | None:
+    """Emit one ``key: value`` block, or None if it needs the dumper."""
+    if _PLAIN_RE.fullmatch(key) is None or key.lower() in _RESERVED:
+        return None
+    column = len(indent) + len(key) + 2
+    if isinstance(value, str):
+        scalar = _plain(value, column)
+        return None if scalar is None else f"{indent}{key}: {scalar}\n"
+    if isinstance(value, list) and key in _LIST_KEYS and value:
+        items = [f"{indent}{key}:\n"]
+        for item in value:
+            scalar = _plain(item, len(indent) + 2) if isinstance(item, str) else None
+            if scalar is None:
+                return None
+            items.append(f"{indent}- {scalar}\n")
+        return "".join(items)
+    if isinstance(value, dict) and value and not indent:
+        entries = [f"{key}:\n"]
+        for sub_key, sub_value in value.items():
+            if not isinstance(sub_key, str):
+                return None
+            entry = _emit_entry(sub_key, sub_value, "  ")
+            if entry is None:
+                return None
+            entries.append(entry)
+        return "".join(entries)
+    return None
+
+
+def _emit_frontmatter(fm: dict[str, Any]) -> str:
+    """Serialize frontmatter; byte-identical to ``yaml.dump`` for our schema."""
+    parts: list[str] = []
+    for key, value in fm.items():
+        entry = _emit_entry(key, value)
+        if entry is None:
+            entry = yaml.dump(
+                {key: value}, Dumper=_Dumper,
+                default_flow_style=False, allow_unicode=True, sort_keys=False,
+            )
+        parts.append(entry)
+    return "".join(parts)
+
 
 def _normalize(text: str, config: PostprocessConfig) -> str:
     """Apply postprocess normalization rules to text."""
@@ -40,12 +126,32 @@ def _normalize(text: str, config: PostprocessConfig) -> str:
     return text
 
 
+class _Placeholders(dict[str, str]):
+    """format_map mapping that leaves unknown {key} placeholders untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> str:
+    """Turn a data.yaml template into a str.format string.
+
+    Only ``{name}`` is a field; every other brace is escaped so templates
+    keep the literal-replacement semantics they have always had.
+    """
+    parts = _FIELD_RE.split(template)
+    return "".join(
+        f"{{{part}}}" if i % 2 else part.replace("{", "{{").replace("}", "}}")
+        for i, part in enumerate(parts)
+    )
+
+
 def _resolve_template(template: str, values: dict[str, str]) -> str:
     """Replace {key} placeholders in a template string."""
-    result = template
-    for key, value in values.items():
-        result = result.replace("{" + key + "}", value)
-    return result
+    if not isinstance(values, _Placeholders):
+        values = _Placeholders(values)
+    return _compile_template(template).format_map(values)
 
 
 def _resolve_frontmatter_base(
@@ -55,6 +161,10 @@ def _resolve_frontmatter_base(
     timestamp: str,
 ) -> dict[str, Any]:
     """Resolve {{...}} placeholders in frontmatter_base."""
+    def _context_value(match: re.Match[str]) -> str:
+        step, key = match.group(1), match.group(2)
+        return str(context.get(step, {}).get(key, ""))
+
     def _resolve(obj: Any) -> Any:
         if isinstance(obj, str):
             result = obj
@@ -63,10 +173,7 @@ def _resolve_frontmatter_base(
             result = result.replace("{{timestamp}}", timestamp)
             # context.metadata.work_uri pattern
             if "{{context." in result:
-                for match in re.finditer(r"\{\{context\.(\w+)\.(\w+)}}", result):
-                    step, key = match.group(1), match.group(2)
-                    val = context.get(step, {}).get(key, "")
-                    result = result.replace(match.group(0), str(val))
+                result = _CTX_RE.sub(_context_value, result)
             return result
         if isinstance(obj, dict):
             return {k: _resolve(v) for k, v in obj.items()}
@@ -77,30 +184,45 @@ def _resolve_frontmatter_base(
     return _resolve(base)
 
 
-def _build_frontmatter(
+def _frontmatter_tail(
     section: SectionDef,
-    values: dict[str, str],
     base: dict[str, Any],
     cross_refs: list[dict[str, str]],
     eurovoc: list[str],
-) -> str:
-    """Build YAML frontmatter string."""
-    fm: dict[str, Any] = {}
-
-    # Section-specific fields
-    for key, template in section.frontmatter.items():
-        fm[key] = _resolve_template(template, values)
+) -> tuple[dict[str, Any], str]:
+    """Serialize the per-document part of a section's frontmatter once.
 
-    # Base fields (source, language, etc.)
-    fm.update(base)
+    Returns the values that override section-specific keys and the YAML
+    for everything after them (base fields, cross-references, eurovoc).
+    """
+    shared: dict[str, Any] = dict(base)
 
     # Cross-references (first 5 CELEX numbers only — full list bloats embeddings)
     if cross_refs:
-        fm["cross_references"] = [ref["celex"] for ref in cross_refs[:5]]
+        shared["cross_references"] = [ref["celex"] for ref in cross_refs[:5]]
     if eurovoc:
-        fm["eurovoc"] = eurovoc
+        shared["eurovoc"] = eurovoc
 
-    return yaml.dump(fm, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    overrides = {k: shared[k] for k in section.frontmatter if k in shared}
+    tail = _emit_frontmatter(
+        {k: v for k, v in shared.items() if k not in section.frontmatter},
+    )
+    return overrides, tail
+
+
+def _build_frontmatter(
+    section: SectionDef,
+    values: dict[str, str],
+    overrides: dict[str, Any],
+    tail: str,
+) -> str:
+    """Build YAML frontmatter string."""
+    # Section-specific fields; shared fields with the same key win in place
+    fm: dict[str, Any] = {
+        key: overrides[key] if key in overrides else _resolve_template(template, values)
+        for key, template in section.frontmatter.items()
+    }
+    return _emit_frontmatter(fm) + tail or "{}\n"
 
 
 def _article_to_markdown(article: Article) -> str:
@@ -108,18 +230,38 @@ def _article_to_markdown(article: Article) -> str:
 
     Items are already inlined in para.text by the parser (preserving document order).
     """
-    lines: list[str] = []
+    buf: list[str] = []
+    w = buf.extend
 
+    # Pieces go straight into the buffer; no per-paragraph f-string copy
     for para in article.paragraphs:
         if para.number:
-            lines.append(f"## {para.number}.")
-            lines.append("")
-
+            w(("## ", para.number, ".\n\n"))
         if para.text:
-            lines.append(para.text)
-            lines.append("")
+            w((para.text, "\n\n"))
+
+    # Every chunk ends in a blank line; drop the final newline to keep the
+    # single trailing "\n" the body has always had.
+    return "".join(buf)[:-1]
 
-    return "\n".join(lines)
+
+def _write_file(item: tuple[Path, bytes]) -> None:
+    path, data = item
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_files(pending: dict[Path, bytes]) -> None:
+    """Flush rendered corpus files, overlapping open/write/close across threads."""
+    with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as pool:
+        # Consume the iterator so the first write error is raised here.
+        for _ in pool.map(_write_file, pending.items()):
+            pass
 
 
 def convert_document(
@@ -148,72 +290,81 @@ def convert_document(
     base_fm = _resolve_frontmatter_base(config.frontmatter_base, context, source, timestamp)
 
     stats: dict[str, int] = {"articles": 0, "recitals": 0, "annexes": 0}
+    # Keyed by path: a repeated filename keeps the last entry, as sequential writes did
+    pending: dict[Path, bytes] = {}
 
     # Articles
     if "articles" in config.sections:
         sec = config.sections["articles"]
+        overrides, tail = _frontmatter_tail(sec, base_fm, cross_refs, eurovoc)
         out_dir = output_dir / sec.dir
         out_dir.mkdir(parents=True, exist_ok=True)
-        counter = summary.counter("articles")
 
         for article in doc.articles:
-            values = {
-                "number": article.number,
-                "title": article.title,
-                "chapter": article.chapter,
-                "chapter_title": article.chapter_title,
-            }
+            values = _Placeholders(
+                number=article.number,
+                title=article.title,
+                chapter=article.chapter,
+                chapter_title=article.chapter_title,
+            )
             heading = _resolve_template(sec.heading, values)
-            frontmatter = _build_frontmatter(sec, values, base_fm, cross_refs, eurovoc)
+            frontmatter = _build_frontmatter(sec, values, overrides, tail)
             body = _article_to_markdown(article)
             content = _normalize(
                 f"---\n{frontmatter}---\n\n# {heading}\n\n{body}", postprocess,
             )
 
             filename = _resolve_template(sec.filename, values)
-            (out_dir / filename).write_text(content, encoding="utf-8")
-            counter.ok += 1
-            stats["articles"] += 1
+            pending[out_dir / filename] = content.encode("utf-8")
+
+        stats["articles"] = len(doc.articles)
 
     # Recitals
     if "recitals" in config.sections:
         sec = config.sections["recitals"]
+        overrides, tail = _frontmatter_tail(sec, base_fm, cross_refs, eurovoc)
         out_dir = output_dir / sec.dir
         out_dir.mkdir(parents=True, exist_ok=True)
-        counter = summary.counter("recitals")
 
         for recital in doc.recitals:
-            values = {"number": recital.number}
+            values = _Placeholders(number=recital.number)
             heading = _resolve_template(sec.heading, values)
-            frontmatter = _build_frontmatter(sec, values, base_fm, cross_refs, eurovoc)
+            frontmatter = _build_frontmatter(sec, values, overrides, tail)
             content = _normalize(
                 f"---\n{frontmatter}---\n\n# {heading}\n\n{recital.text}\n", postprocess,
             )
 
             filename = _resolve_template(sec.filename, values)
-            (out_dir / filename).write_text(content, encoding="utf-8")
-            counter.ok += 1
-            stats["recitals"] += 1
+            pending[out_dir / filename] = content.encode("utf-8")
+
+        stats["recitals"] = len(doc.recitals)
 
     # Annexes
     if "annexes" in config.sections:
         sec = config.sections["annexes"]
+        overrides, tail = _frontmatter_tail(sec, base_fm, cross_refs, eurovoc)
         out_dir = output_dir / sec.dir
         out_dir.mkdir(parents=True, exist_ok=True)
-        counter = summary.counter("annexes")
 
         for annex in doc.annexes:
-            values = {"number": annex.number, "title": annex.title}
+            values = _Placeholders(number=annex.number, title=annex.title)
             heading = _resolve_template(sec.heading, values)
-            frontmatter = _build_frontmatter(sec, values, base_fm, cross_refs, eurovoc)
+            frontmatter = _build_frontmatter(sec, values, overrides, tail)
             content = _normalize(
                 f"---\n{frontmatter}---\n\n# {heading}\n\n{annex.content}\n", postprocess,
             )
 
             filename = _resolve_template(sec.filename, values)
-            (out_dir / filename).write_text(content, encoding="utf-8")
-            counter.ok += 1
-            stats["annexes"] += 1
+            pending[out_dir / filename] = content.encode("utf-8")
+
+        stats["annexes"] = len(doc.annexes)
+
+    _write_files(pending)
+
+    # Counted only once every file is on disk
+    for name, count in stats.items():
+        if name in config.sections:
+            summary.counter(name).ok += count
 
     log.info(
         "Converted: %d articles, %d recitals, %d annexes",
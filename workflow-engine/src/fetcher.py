@@ -19,18 +19,18 @@ Downloads to a temporary directory provided by the pipeline orchestrator.
 
 from __future__ import annotations
 
+import os
+import shutil
 import ssl
-import time
-import urllib.error
-import urllib.request
+import tempfile
 import zipfile
-from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import certifi
+import urllib3
 
-from src.config import FetchConfig
+from src.config import FetchConfig, RetryConfig
 from src.logger import get_logger
 from src.result import Fail, Ok, Result
 from src.sparql.processor import execute_script
@@ -39,6 +39,13 @@ log = get_logger(__name__)
 
 _ssl_ctx = ssl.create_default_context(cafile=certifi.where())
 
+_CHUNK = 1 << 20  # 1 MiB copy buffer
+_SPOOL_MAX = 4 * 1024 * 1024  # keep small downloads in memory
+_RETRY_STATUSES = frozenset(range(400, 600))  # any HTTP error, as urlopen raised
+
+# Shared pool: retries and later downloads reuse the TCP/TLS connection
+_http = urllib3.PoolManager(maxsize=2, ssl_context=_ssl_ctx)
+
 
 def select_uri(
     script: str,
@@ -60,37 +67,128 @@ def select_uri(
     return Ok(data=result.data)
 
 
-def _download(url: str, accept: str, timeout: int = 30) -> Result[bytes]:
-    """Single download attempt."""
-    req = urllib.request.Request(
-        url,
-        headers={"Accept": accept},
-        method="GET",
+class _WorkflowRetry(urllib3.Retry):
+    """urllib3 Retry with the workflow's semantics.
+
+    Every failed attempt is logged, and each retry waits a fixed
+    ``backoff_factor`` seconds (the workflow's delay_seconds) rather than
+    urllib3's exponential schedule. Redirects are not failures and never wait.
+    """
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: Any = None,
+        error: Exception | None = None,
+        _pool: Any = None,
+        _stacktrace: Any = None,
+    ) -> urllib3.Retry:
+        if error is not None or (response is not None and response.status in _RETRY_STATUSES):
+            attempt = 1 + sum(1 for h in self.history if h.redirect_location is None)
+            reason = error if error is not None else f"HTTP {response.status}"
+            log.warning("Attempt %d failed: %s", attempt, reason)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    def get_backoff_time(self) -> float:
+        if self.history and self.history[-1].redirect_location is None:
+            return float(self.backoff_factor)
+        return 0.0
+
+
+def _retry_policy(retry: RetryConfig) -> urllib3.Retry:
+    """Map the workflow retry block onto urllib3's Retry.
+
+    ``attempts`` counts the first request; every retry waits delay_seconds.
+    Redirects have their own budget so they never consume attempts.
+    """
+    errors = max(retry.attempts - 1, 0)
+    return _WorkflowRetry(
+        total=None,
+        connect=errors,
+        read=errors,
+        status=errors,
+        other=errors,
+        redirect=10,
+        backoff_factor=retry.delay_seconds,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+        respect_retry_after_header=False,
     )
+
+
+def _download(
+    url: str,
+    accept: str,
+    retry: RetryConfig,
+    timeout: int = 30,
+) -> Result[BinaryIO]:
+    """Download with retry, spooled to a temporary file (rewound on success)."""
+    buf = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX)  # noqa: SIM115
+    retries = _retry_policy(retry)
     try:
-        with urllib.request.urlopen(req, timeout=timeout, context=_ssl_ctx) as resp:
-            return Ok(data=resp.read())
-    except urllib.error.HTTPError as exc:
-        return Fail(error=f"HTTP {exc.code}: {exc.reason}", context=url)
-    except urllib.error.URLError as exc:
-        return Fail(error=f"Connection error: {exc.reason}", context=url)
-    except TimeoutError:
+        while True:
+            resp = _http.request(
+                "GET", url,
+                headers={"Accept": accept},
+                retries=retries,
+                timeout=timeout,
+                preload_content=False,
+            )
+            try:
+                if resp.status >= 400:
+                    buf.close()
+                    return Fail(
+                        error=f"All {retry.attempts} download attempts failed: "
+                        f"HTTP {resp.status}: {resp.reason}",
+                        context=url,
+                    )
+                try:
+                    shutil.copyfileobj(resp, buf, _CHUNK)
+                    break
+                except (
+                    urllib3.exceptions.ProtocolError,
+                    urllib3.exceptions.ReadTimeoutError,
+                ) as exc:
+                    # Body reads fail after urllib3's own retry loop; charge the same budget
+                    retries = resp.retries.increment("GET", url, error=exc)
+            finally:
+                resp.release_conn()
+            buf.seek(0)
+            buf.truncate()
+            retries.sleep()
+    except urllib3.exceptions.MaxRetryError as exc:
+        buf.close()
+        return Fail(
+            error=f"All {retry.attempts} download attempts failed: {exc.reason}",
+            context=url,
+        )
+    except urllib3.exceptions.TimeoutError:
+        buf.close()
         return Fail(error=f"Timeout after {timeout}s", context=url)
+    except urllib3.exceptions.HTTPError as exc:
+        buf.close()
+        return Fail(error=f"Connection error: {exc}", context=url)
+    buf.seek(0)
+    return Ok(data=buf)
 
 
-def _extract_zip(data: bytes, out_dir: Path) -> Result[list[Path]]:
+def _extract_zip(data: BinaryIO, out_dir: Path) -> Result[list[Path]]:
     """Extract ZIP archive contents to output directory."""
     try:
-        zf = zipfile.ZipFile(BytesIO(data))
+        zf = zipfile.ZipFile(data)
     except zipfile.BadZipFile as exc:
         return Fail(error=f"Invalid ZIP: {exc}")
 
     extracted: list[Path] = []
-    for name in zf.namelist():
-        target = out_dir / name
-        target.write_bytes(zf.read(name))
-        extracted.append(target)
-        log.info("Extracted: %s", name)
+    with zf:
+        for name in zf.namelist():
+            target = out_dir / name
+            with zf.open(name) as src, target.open("wb") as dst:
+                shutil.copyfileobj(src, dst, _CHUNK)
+            extracted.append(target)
+            log.info("Extracted: %s", name)
 
     return Ok(data=extracted)
 
@@ -109,34 +207,25 @@ def fetch_document(
     url: str = uri_result.data
     log.info("Selected URI: %s", url)
 
-    # Download with retry
-    data: bytes | None = None
-    last_error = ""
-
-    for attempt in range(1, config.retry.attempts + 1):
-        log.info("Download attempt %d/%d", attempt, config.retry.attempts)
-        dl_result = _download(url, config.accept_header)
-        if dl_result.ok:
-            data = dl_result.data
-            break
-        last_error = dl_result.error
-        log.warning("Attempt %d failed: %s", attempt, last_error)
-        if attempt < config.retry.attempts:
-            time.sleep(config.retry.delay_seconds)
-
-    if data is None:
-        return Fail(error=f"All {config.retry.attempts} download attempts failed: {last_error}")
-
-    log.info("Downloaded %d bytes", len(data))
-
-    # Extract if ZIP
-    if config.content_type == "zip":
-        extract_result = _extract_zip(data, tmp_dir)
-        if not extract_result.ok:
-            return extract_result  # type: ignore[return-value]
-        log.info("Extracted %d files to %s", len(extract_result.data), tmp_dir)
-    else:
-        # Non-ZIP: write raw content
-        (tmp_dir / "content.xml").write_bytes(data)
+    log.info("Downloading (up to %d attempts)", config.retry.attempts)
+    dl_result = _download(url, config.accept_header, config.retry)
+    if not dl_result.ok:
+        return dl_result  # type: ignore[return-value]
+    data = dl_result.data
+
+    with data:
+        log.info("Downloaded %d bytes", data.seek(0, os.SEEK_END))
+        data.seek(0)
+
+        # Extract if ZIP
+        if config.content_type == "zip":
+            extract_result = _extract_zip(data, tmp_dir)
+            if not extract_result.ok:
+                return extract_result  # type: ignore[return-value]
+            log.info("Extracted %d files to %s", len(extract_result.data), tmp_dir)
+        else:
+            # Non-ZIP: write raw content
+            with (tmp_dir / "content.xml").open("wb") as dst:
+                shutil.copyfileobj(data, dst, _CHUNK)
 
     return Ok(data=tmp_dir)
\ No newline at end of file
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MIT
+#
+#  █████╗ ██████╗  █████╗ ███████╗
+# ██╔══██╗██╔══██╗██╔══██╗██╔════╝
+# ███████║██████╔╝███████║███████╗
+# ██╔══██║██╔══██╗██╔══██║╚════██║
+# ██║  ██║██║  ██║██║  ██║███████║
+# ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝
+# Copyright (C) 2026 Riza Emre ARAS <r.emrearas@proton.me>
+#
+# Licensed under the MIT License.
+# See LICENSE and THIRD_PARTY_LICENSES for details.
+
+"""Shared Formex XML helpers for the parser and the validator.
+
+Text extraction, iterparse options, streaming release, and the source
+file layout of an extracted Formex archive.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from lxml import etree
+
+# noinspection PyProtectedMember
+XmlElement = etree._Element
+
+# Formex files are local and self-contained: no ID table, no DTD entities
+# or network fetches. Blank text is kept — it separates inline elements.
+ITERPARSE_OPTS: dict[str, Any] = {
+    "collect_ids": False,
+    "huge_tree": True,
+    "no_network": True,
+    "resolve_entities": False,
+}
+
+
+def element_text(element: XmlElement | None) -> str:
+    """Extract all text content from an element, stripping whitespace."""
+    if element is None:
+        return ""
+    if not len(element):
+        # Leaf: text plus tail is exactly what the text serializer emits.
+        text, tail = element.text, element.tail
+        if tail:
+            return ((text or "") + tail).strip()
+        return text.strip() if text else ""
+    return (etree.tostring(element, method="text", encoding="unicode") or "").strip()
+
+
+def release_element(element: XmlElement) -> None:
+    """Drop a processed element's subtree and its already-processed siblings."""
+    element.clear(keep_tail=True)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def split_source_files(source_dir: Path) -> tuple[list[Path], list[Path]]:
+    """Split extracted XML files into (main ACT files, annex files), sorted.
+
+    One directory scan; toc and doc files are never content. The main ACT
+    matches both Formex naming conventions:
+      AI Act:  *.000101.fmx.xml
+      GDPR:    *.01000101.xml
+    Annexes are any other XML file.
+    """
+    try:
+        with os.scandir(source_dir) as entries:
+            names = sorted(
+                name for entry in entries
+                if (name := entry.name).endswith(".xml")
+                and not name.startswith(".")  # e.g. macOS ._* resource forks
+                and ".doc." not in name and ".toc." not in name
+            )
+    except OSError:  # missing/unreadable directory: nothing found, like glob()
+        return [], []
+    act_files = [source_dir / name for name in names if "0101" in name]
+    annex_files = [source_dir / name for name in names if "0101" not in name]
+    return act_files, annex_files
@@ -37,7 +37,7 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
-@dataclass
+@dataclass(slots=True)
 class StepCounter:
     """Tracks success/fail counts for a single pipeline step."""
 
@@ -46,7 +46,7 @@ class StepCounter:
     failed: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineSummary:
     """Accumulates counters across all pipeline steps."""
 
@@ -21,34 +21,47 @@ Parses Formex 4 XML structure (verified against actual EU AI Act XML):
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable
 
 from lxml import etree
 
+from src.formex import (
+    ITERPARSE_OPTS,
+    XmlElement,
+    element_text,
+    release_element,
+    split_source_files,
+)
 from src.logger import get_logger
 from src.result import Fail, Ok, Result
 
-# noinspection PyProtectedMember
-_XmlElement = etree._Element
-
 log = get_logger(__name__)
 
+_NO_CHAPTER = ("", "")
+
+# Multi-step paths compiled once; single-step lookups use _child/_children.
+_XP_TITLE_TI = etree.XPath("TITLE/TI", smart_strings=False)
+_XP_TITLE_STI = etree.XPath("TITLE/STI", smart_strings=False)
 
-@dataclass
+
+@dataclass(slots=True)
 class Item:
     letter: str
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     number: str
     text: str
     items: list[Item] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     number: str
     title: str
@@ -57,216 +70,334 @@ class Article:
     paragraphs: list[Paragraph] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Recital:
     number: str
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Annex:
     number: str
     title: str
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedDocument:
     articles: list[Article] = field(default_factory=list)
     recitals: list[Recital] = field(default_factory=list)
     annexes: list[Annex] = field(default_factory=list)
 
 
-def _text(element: _XmlElement | None) -> str:
-    """Extract all text content from an element, stripping whitespace."""
-    if element is None:
-        return ""
-    return (etree.tostring(element, method="text", encoding="unicode") or "").strip()
+def _child(element: XmlElement, tag: str) -> XmlElement | None:
+    """First direct child with ``tag`` — ``element.find(tag)`` without path parsing."""
+    return next(element.iterchildren(tag), None)
+
+
+def _children(element: XmlElement, tag: str) -> list[XmlElement]:
+    """Direct children with ``tag`` — ``element.findall(tag)`` without path parsing."""
+    return list(element.iterchildren(tag))
+
+
+def _first(xpath: etree.XPath, element: XmlElement) -> XmlElement | None:
+    """First match of a precompiled multi-step path — ``element.find(path)``."""
+    hits = xpath(element)
+    return hits[0] if hits else None
 
 
-def _table_to_text(tbl: _XmlElement) -> str:
+def _tag_map(element: XmlElement) -> dict[str, XmlElement]:
+    """First child per tag, collected in a single pass over the children."""
+    first: dict[str, XmlElement] = {}
+    for child in element:
+        if child.tag not in first:
+            first[child.tag] = child
+    return first
+
+
+def _table_to_text(tbl: XmlElement) -> str:
     """Extract readable text from a TBL element."""
     rows: list[str] = []
     for row in tbl.iter("ROW"):
-        cells = [_text(cell) for cell in row.findall("CELL")]
+        cells = [element_text(cell) for cell in row.iterchildren("CELL")]
         rows.append(" | ".join(c for c in cells if c))
-    return "\n".join(rows) if rows else _text(tbl)
+    return "\n".join(rows) if rows else element_text(tbl)
+
+
+_STRUCTURED_TAGS = ("LIST", "NP", "GR.SEQ", "TBL")
+
+
+# ── Block handlers for _element_to_text ───────────────────────
+# Each appends the text of one child element to parts.
+
+
+def _block_p(child: XmlElement, parts: list[str]) -> None:
+    # If P has structured children (LIST, NP, etc.), recurse
+    if next(child.iterchildren(*_STRUCTURED_TAGS), None) is not None:
+        parts.append(_element_to_text(child))
+    else:
+        parts.append(element_text(child))
+
+
+def _block_list(child: XmlElement, parts: list[str]) -> None:
+    parts.append(_parse_list(child))
+
+
+def _block_np(child: XmlElement, parts: list[str]) -> None:
+    no_p = element_text(_child(child, "NO.P"))
+    txt = element_text(_child(child, "TXT"))
+    parts.append(f"{no_p} {txt}" if no_p else txt)
+
+
+def _block_gr_seq(child: XmlElement, parts: list[str]) -> None:
+    ti = element_text(_first(_XP_TITLE_TI, child))
+    sti = element_text(_first(_XP_TITLE_STI, child))
+    title = f"{ti} — {sti}" if ti and sti else (ti or sti)
+    if title:
+        parts.append(f"\n### {title}\n")
+    for sub in child:
+        if sub.tag != "TITLE":
+            parts.append(_element_to_text(sub))
+
+
+def _block_tbl(child: XmlElement, parts: list[str]) -> None:
+    parts.append(_table_to_text(child))
 
 
-def _element_to_text(element: _XmlElement) -> str:
+def _block_item(child: XmlElement, parts: list[str]) -> None:
+    item = _tag_map(child)
+    np = item.get("NP")
+    if np is None:
+        parts.append(element_text(child))
+        return
+    np_map = _tag_map(np)
+    no_p = element_text(np_map.get("NO.P"))
+    txt_el = np_map.get("TXT")
+    txt = element_text(txt_el) if txt_el is not None else element_text(np)
+    parts.append(f"{no_p} {txt}" if no_p else txt)
+    nested = _find_nested_list(item, np_map)
+    if nested is not None:
+        parts.append(_parse_list(nested))
+    # QUOT.S inside NP > P (amendment articles)
+    for p_el in _children(np, "P"):
+        quot = _child(p_el, "QUOT.S")
+        if quot is not None:
+            parts.append(_element_to_text(quot))
+
+
+def _block_skip(child: XmlElement, parts: list[str]) -> None:
+    """Skip footnotes in body text."""
+
+
+def _block_default(child: XmlElement, parts: list[str]) -> None:
+    t = element_text(child)
+    if t:
+        parts.append(t)
+
+
+_BLOCK_HANDLERS: dict[Any, Callable[[XmlElement, list[str]], None]] = {
+    "P": _block_p,
+    "LIST": _block_list,
+    "NP": _block_np,
+    "GR.SEQ": _block_gr_seq,
+    "TBL": _block_tbl,
+    "ITEM": _block_item,
+    "NOTE": _block_skip,
+}
+
+
+def _element_to_text(element: XmlElement) -> str:
     """Convert an element and its children to plain text, preserving structure."""
     parts: list[str] = []
 
-    if element.text and element.text.strip():
-        parts.append(element.text.strip())
+    text = element.text
+    if text and (text := text.strip()):
+        parts.append(text)
 
+    handlers = _BLOCK_HANDLERS
     for child in element:
-        tag = child.tag if isinstance(child.tag, str) else ""
-
-        if tag == "P":
-            # If P has structured children (LIST, NP, etc.), recurse
-            if any(hasattr(gc, "tag") and gc.tag in ("LIST", "NP", "GR.SEQ", "TBL") for gc in child):
-                parts.append(_element_to_text(child))
-            else:
-                parts.append(_text(child))
-        elif tag == "LIST":
-            parts.append(_parse_list(child))
-        elif tag == "NP":
-            no_p = _text(child.find("NO.P"))
-            txt = _text(child.find("TXT"))
-            parts.append(f"{no_p} {txt}" if no_p else txt)
-        elif tag == "GR.SEQ":
-            ti = _text(child.find("TITLE/TI"))
-            sti = _text(child.find("TITLE/STI"))
-            title = f"{ti} — {sti}" if ti and sti else (ti or sti)
-            if title:
-                parts.append(f"\n### {title}\n")
-            for sub in child:
-                if sub.tag != "TITLE":
-                    parts.append(_element_to_text(sub))
-        elif tag == "TBL":
-            parts.append(_table_to_text(child))
-        elif tag == "ITEM":
-            np = child.find("NP")
-            if np is not None:
-                no_p = _text(np.find("NO.P"))
-                txt_el = np.find("TXT")
-                txt = _text(txt_el) if txt_el is not None else _text(np)
-                parts.append(f"{no_p} {txt}" if no_p else txt)
-                nested = _find_nested_list(child, np)
-                if nested is not None:
-                    parts.append(_parse_list(nested))
-                # QUOT.S inside NP > P (amendment articles)
-                for p_el in np.findall("P"):
-                    quot = p_el.find("QUOT.S")
-                    if quot is not None:
-                        parts.append(_element_to_text(quot))
-            else:
-                parts.append(_text(child))
-        elif tag == "NOTE":
-            pass  # Skip footnotes in body text
-        else:
-            t = _text(child)
-            if t:
-                parts.append(t)
+        # Comments and PIs have a factory as .tag and fall through to the default
+        handlers.get(child.tag, _block_default)(child, parts)
 
-        if child.tail and child.tail.strip():
-            parts.append(child.tail.strip())
+        tail = child.tail
+        if tail and (tail := tail.strip()):
+            parts.append(tail)
 
     return "\n\n".join(p for p in parts if p)
 
 
-def _find_nested_list(item_el: _XmlElement, np: _XmlElement | None) -> _XmlElement | None:
-    """Find a nested LIST in ITEM, checking TXT > NP > NP/P > ITEM positions."""
+def _find_nested_list(
+    item: dict[str, XmlElement],
+    np: dict[str, XmlElement] | None,
+) -> XmlElement | None:
+    """Find a nested LIST in ITEM, checking TXT > NP > NP/P > ITEM positions.
+
+    Takes the ``_tag_map`` of the ITEM and of its NP (if any).
+    """
     if np is not None:
-        txt_el = np.find("TXT")
+        txt_el = np.get("TXT")
         if txt_el is not None:
-            nested = txt_el.find("LIST")
+            nested = _child(txt_el, "LIST")
             if nested is not None:
                 return nested
-        nested = np.find("LIST")
+        nested = np.get("LIST")
         if nested is not None:
             return nested
         # LIST inside P which is inside NP (common in annexes)
-        p_el = np.find("P")
+        p_el = np.get("P")
         if p_el is not None:
-            nested = p_el.find("LIST")
+            nested = _child(p_el, "LIST")
             if nested is not None:
                 return nested
-    return item_el.find("LIST")
+    return item.get("LIST")
+
 
+def _parse_list(list_el: XmlElement) -> str:
+    """Parse a LIST element into formatted text.
 
-def _parse_list(list_el: _XmlElement) -> str:
-    """Parse a LIST element into formatted text (recursive)."""
+    Nested LISTs are walked with an explicit stack of ITEM iterators.
+    Every level is joined with blank lines, so nested items are
+    flattened into one list. The exception is an empty nested LIST,
+    which still contributes one empty entry.
+    """
     items: list[str] = []
-    for item_el in list_el.findall("ITEM"):
-        np = item_el.find("NP")
-        nested = _find_nested_list(item_el, np)
-
-        if np is not None:
-            no_p = _text(np.find("NO.P"))
-            txt_el = np.find("TXT")
-            txt = _text(txt_el) if txt_el is not None else _text(np)
-            if nested is not None:
-                if txt:
-                    items.append(f"{no_p} {txt}" if no_p else txt)
-                items.append(_parse_list(nested))
-            else:
+    stack = [list_el.iterchildren("ITEM")]
+    starts = [0]
+    while stack:
+        item_el = next(stack[-1], None)
+        if item_el is None:
+            stack.pop()
+            if stack and len(items) == starts.pop():
+                items.append("")
+            continue
+        item = _tag_map(item_el)
+        np = item.get("NP")
+        np_map = _tag_map(np) if np is not None else None
+        nested = _find_nested_list(item, np_map)
+
+        if np_map is not None:
+            no_p = element_text(np_map.get("NO.P"))
+            txt_el = np_map.get("TXT")
+            txt = element_text(txt_el) if txt_el is not None else element_text(np)
+            if nested is None or txt:
                 items.append(f"{no_p} {txt}" if no_p else txt)
         else:
-            alinea = item_el.find("ALINEA")
+            alinea = item.get("ALINEA")
             if alinea is not None:
-                a_nested = alinea.find("LIST")
-                if a_nested is not None:
-                    p_el = alinea.find("P")
+                nested = _child(alinea, "LIST")
+                if nested is not None:
+                    p_el = _child(alinea, "P")
                     if p_el is not None:
-                        items.append(_text(p_el))
-                    items.append(_parse_list(a_nested))
+                        items.append(element_text(p_el))
                 else:
                     items.append(_element_to_text(alinea))
-            elif nested is not None:
-                items.append(_parse_list(nested))
-            else:
-                items.append(_text(item_el))
+            elif nested is None:
+                items.append(element_text(item_el))
+        if nested is not None:
+            stack.append(nested.iterchildren("ITEM"))
+            starts.append(len(items))
     return "\n\n".join(items)
 
 
 def _collect_list_items(
-    list_el: _XmlElement,
+    list_el: XmlElement,
     parts: list[str],
     items: list[Item],
 ) -> None:
-    """Recursively collect items from a LIST element.
+    """Collect items from a LIST element and its nested LISTs.
 
     Adds items inline to parts (for correct ordering in text) and
     also populates the items list (for structured access).
-    Checks TXT > NP > ITEM positions for nested LISTs.
+    Checks TXT > NP > ITEM positions for nested LISTs, descending
+    through an explicit stack of ITEM iterators.
     """
-    for item_el in list_el.findall("ITEM"):
-        np = item_el.find("NP")
-        nested = _find_nested_list(item_el, np)
-
-        if np is not None:
-            letter = _text(np.find("NO.P")).strip("()")
-            txt_el = np.find("TXT")
-            txt = _text(txt_el) if txt_el is not None else _text(np)
+    stack = [list_el.iterchildren("ITEM")]
+    while stack:
+        item_el = next(stack[-1], None)
+        if item_el is None:
+            stack.pop()
+            continue
+        item = _tag_map(item_el)
+        np = item.get("NP")
+        np_map = _tag_map(np) if np is not None else None
+        nested = _find_nested_list(item, np_map)
+
+        if np_map is not None:
+            letter = element_text(np_map.get("NO.P")).strip("()")
+            txt_el = np_map.get("TXT")
+            txt = element_text(txt_el) if txt_el is not None else element_text(np)
             if nested is not None:
                 if txt:
                     items.append(Item(letter=letter, text=txt))
                     parts.append(f"({letter}) {txt}")
-                _collect_list_items(nested, parts, items)
             else:
                 items.append(Item(letter=letter, text=txt))
                 parts.append(f"({letter}) {txt}")
                 # QUOT.S inside NP > P (amendment articles)
-                for p_el in np.findall("P"):
-                    quot = p_el.find("QUOT.S")
+                for p_el in np.iterchildren("P"):
+                    quot = _child(p_el, "QUOT.S")
                     if quot is not None:
                         qt = _element_to_text(quot)
                         if qt:
                             parts.append(qt)
         else:
-            alinea = item_el.find("ALINEA")
+            alinea = item.get("ALINEA")
             if alinea is not None:
-                a_nested = alinea.find("LIST")
-                if a_nested is not None:
-                    p_el = alinea.find("P")
+                nested = _child(alinea, "LIST")
+                if nested is not None:
+                    p_el = _child(alinea, "P")
                     if p_el is not None:
-                        parts.append(_text(p_el))
-                    _collect_list_items(a_nested, parts, items)
+                        parts.append(element_text(p_el))
                 else:
                     parts.append(_element_to_text(alinea))
-            elif nested is not None:
-                _collect_list_items(nested, parts, items)
-            else:
-                t = _text(item_el)
+            elif nested is None:
+                t = element_text(item_el)
                 if t:
                     items.append(Item(letter="", text=t))
                     parts.append(f"- {t}")
+        if nested is not None:
+            stack.append(nested.iterchildren("ITEM"))
+
+
+# ── Handlers for ALINEA children ──────────────────────────────
+# Like the block handlers, but LISTs also feed the structured items.
+
+
+def _alinea_p(child: XmlElement, parts: list[str], items: list[Item]) -> None:
+    parts.append(element_text(child))
+
+
+def _alinea_list(child: XmlElement, parts: list[str], items: list[Item]) -> None:
+    _collect_list_items(child, parts, items)
+
+
+def _alinea_np(child: XmlElement, parts: list[str], items: list[Item]) -> None:
+    no_p = element_text(_child(child, "NO.P"))
+    txt = element_text(_child(child, "TXT"))
+    if txt:
+        parts.append(f"{no_p} {txt}" if no_p else txt)
+
+
+def _alinea_skip(child: XmlElement, parts: list[str], items: list[Item]) -> None:
+    """Skip footnotes."""
+
+
+def _alinea_default(child: XmlElement, parts: list[str], items: list[Item]) -> None:
+    t = element_text(child)
+    if t:
+        parts.append(t)
+
+
+_ALINEA_HANDLERS: dict[Any, Callable[[XmlElement, list[str], list[Item]], None]] = {
+    "P": _alinea_p,
+    "LIST": _alinea_list,
+    "NP": _alinea_np,
+    "NOTE": _alinea_skip,
+}
 
 
 def _process_alinea_children(
-    alinea: _XmlElement,
+    alinea: XmlElement,
     parts: list[str],
     items: list[Item],
 ) -> None:
@@ -274,170 +405,217 @@ def _process_alinea_children(
     if alinea.text and alinea.text.strip():
         parts.append(alinea.text.strip())
 
+    handlers = _ALINEA_HANDLERS
     for child in alinea:
-        tag = child.tag if isinstance(child.tag, str) else ""
-        if tag == "P":
-            parts.append(_text(child))
-        elif tag == "LIST":
-            _collect_list_items(child, parts, items)
-        elif tag == "NP":
-            no_p = _text(child.find("NO.P"))
-            txt = _text(child.find("TXT"))
-            if txt:
-                parts.append(f"{no_p} {txt}" if no_p else txt)
-        elif tag == "NOTE":
-            pass
-        else:
-            t = _text(child)
-            if t:
-                parts.append(t)
+        handlers.get(child.tag, _alinea_default)(child, parts, items)
 
 
-def _parse_paragraph(parag: _XmlElement) -> Paragraph:
+def _parse_paragraph(parag: XmlElement) -> Paragraph:
     """Parse a PARAG element."""
-    no = _text(parag.find("NO.PARAG")).rstrip(".")
+    no = element_text(_child(parag, "NO.PARAG")).rstrip(".")
 
     items: list[Item] = []
     text_parts: list[str] = []
 
-    alineas = parag.findall("ALINEA")
+    alineas = _children(parag, "ALINEA")
 
     if alineas:
         for alinea in alineas:
             _process_alinea_children(alinea, text_parts, items)
     else:
-        text_parts.append(_text(parag))
+        text_parts.append(element_text(parag))
 
     return Paragraph(number=no, text="\n\n".join(text_parts), items=items)
 
 
-def _find_chapter_context(element: _XmlElement) -> tuple[str, str]:
-    """Walk up DIVISION ancestors to find the nearest CHAPTER-level title.
+def _parse_article(art_el: XmlElement, chapter: tuple[str, str]) -> Article:
+    """Parse one ARTICLE element under the given (chapter, chapter_title)."""
+    number = element_text(_child(art_el, "TI.ART")).replace("Article", "").strip()
+    title = element_text(_child(art_el, "STI.ART"))
 
-    Formex hierarchy: TITLE > CHAPTER > SECTION > ARTICLE
-    We want the CHAPTER level, not the SECTION level.
-    """
-    current = element
-    while current is not None:
-        if current.tag == "DIVISION":
-            ti = _text(current.find("TITLE/TI"))
-            if ti and ("CHAPTER" in ti.upper() or "TITLE" in ti.upper()):
-                sti = _text(current.find("TITLE/STI"))
-                return ti, sti
-        current = current.getparent()
-    return "", ""
-
-
-def parse_articles(root: _XmlElement) -> list[Article]:
-    """Parse all ARTICLE elements from the ACT."""
-    articles: list[Article] = []
+    parags = _children(art_el, "PARAG")
+    if parags:
+        paragraphs = [_parse_paragraph(p) for p in parags]
+    else:
+        # Articles without PARAG wrapper (e.g. Article 3 Definitions)
+        # have ALINEA directly under ARTICLE
+        items: list[Item] = []
+        text_parts: list[str] = []
+        for alinea in _children(art_el, "ALINEA"):
+            _process_alinea_children(alinea, text_parts, items)
+        if text_parts or items:
+            paragraphs = [Paragraph(number="", text="\n\n".join(text_parts), items=items)]
+        else:
+            paragraphs = []
+
+    return Article(
+        number=number,
+        title=title,
+        chapter=chapter[0],
+        chapter_title=chapter[1],
+        paragraphs=paragraphs,
+    )
 
-    for art_el in root.iter("ARTICLE"):
-        number = _text(art_el.find("TI.ART")).replace("Article", "").strip()
-        title = _text(art_el.find("STI.ART"))
 
-        parent_div = art_el.getparent()
-        chapter, chapter_title = _find_chapter_context(parent_div)
+def _parse_recital(consid: XmlElement) -> Recital | None:
+    """Parse one CONSID element; None when it has no NP."""
+    np = _child(consid, "NP")
+    if np is None:
+        return None
+    number = element_text(_child(np, "NO.P")).strip("()")
+    txt_el = _child(np, "TXT")
+    text = element_text(txt_el) if txt_el is not None else _element_to_text(np)
+    return Recital(number=number, text=text)
 
-        parags = art_el.findall("PARAG")
-        if parags:
-            paragraphs = [_parse_paragraph(p) for p in parags]
-        else:
-            # Articles without PARAG wrapper (e.g. Article 3 Definitions)
-            # have ALINEA directly under ARTICLE
-            items: list[Item] = []
-            text_parts: list[str] = []
-            for alinea in art_el.findall("ALINEA"):
-                _process_alinea_children(alinea, text_parts, items)
-            if text_parts or items:
-                paragraphs = [Paragraph(number="", text="\n\n".join(text_parts), items=items)]
-            else:
-                paragraphs = []
 
-        articles.append(Article(
-            number=number,
-            title=title,
-            chapter=chapter,
-            chapter_title=chapter_title,
-            paragraphs=paragraphs,
-        ))
+def _chapter_of(division: XmlElement) -> tuple[str, str] | None:
+    """(ti, sti) if this DIVISION is CHAPTER/TITLE level, else None."""
+    ti = element_text(_first(_XP_TITLE_TI, division))
+    upper = ti.upper()
+    if "CHAPTER" in upper or "TITLE" in upper:
+        return ti, element_text(_first(_XP_TITLE_STI, division))
+    return None
 
-    log.info("Parsed %d articles", len(articles))
+
+def _walk_articles(art_el: XmlElement, chapter: tuple[str, str]) -> list[Article]:
+    """Parse an ARTICLE and any quoted inside it (e.g. amendment QUOT.S).
+
+    One iterwalk in document order keeps the effective chapter of every
+    open DIVISION on a stack, so nested articles never walk ancestors.
+    """
+    articles: list[Article] = []
+    chapters = [chapter]
+    for event, el in etree.iterwalk(art_el, events=("start", "end"), tag=("DIVISION", "ARTICLE")):
+        if el.tag == "ARTICLE":
+            if event == "start":
+                articles.append(_parse_article(el, chapters[-1]))
+        elif event == "start":
+            chapters.append(_chapter_of(el) or chapters[-1])
+        else:
+            chapters.pop()
     return articles
 
 
-def parse_recitals(root: _XmlElement) -> list[Recital]:
-    """Parse all CONSID elements from the PREAMBLE."""
-    recitals: list[Recital] = []
+def _stream_act(act_path: Path) -> tuple[list[Article], list[Recital]]:
+    """Parse articles and recitals from the ACT in one streaming pass.
 
-    for consid in root.iter("CONSID"):
-        np = consid.find("NP")
-        if np is None:
+    Each top-level ARTICLE/CONSID is released once parsed, so peak
+    memory is bounded by the largest one rather than the whole ACT.
+    Chapter context comes from a stack of open DIVISIONs; a DIVISION's
+    entry is filled in when its TITLE closes, which in Formex precedes
+    its articles.
+    """
+    articles: list[Article] = []
+    recitals: list[Recital] = []
+    # One [chapter, titled] entry per open DIVISION; chapter is inherited
+    # from the enclosing DIVISION until this one's own TITLE qualifies.
+    divisions: list[list[Any]] = []
+    article_depth = 0
+
+    for event, el in etree.iterparse(  # noqa: S320
+        str(act_path),
+        events=("start", "end"),
+        tag=("DIVISION", "TITLE", "ARTICLE", "CONSID"),
+        **ITERPARSE_OPTS,
+    ):
+        tag = el.tag
+        if event == "start":
+            if tag == "DIVISION":
+                divisions.append([divisions[-1][0] if divisions else _NO_CHAPTER, False])
+            elif tag == "ARTICLE":
+                article_depth += 1
             continue
-        number = _text(np.find("NO.P")).strip("()")
-        txt_el = np.find("TXT")
-        text = _text(txt_el) if txt_el is not None else _element_to_text(np)
-        recitals.append(Recital(number=number, text=text))
 
+        if tag == "TITLE":
+            parent = el.getparent()
+            if divisions and parent is not None and parent.tag == "DIVISION":
+                entry = divisions[-1]
+                ti_el = _child(el, "TI")
+                if not entry[1] and ti_el is not None:
+                    entry[1] = True
+                    ti = element_text(ti_el)
+                    upper = ti.upper()
+                    if "CHAPTER" in upper or "TITLE" in upper:
+                        entry[0] = (ti, element_text(_child(el, "STI")))
+        elif tag == "DIVISION":
+            divisions.pop()
+        elif tag == "ARTICLE":
+            article_depth -= 1
+            if article_depth:
+                continue  # quoted ARTICLE — parsed with its outermost one
+            articles.extend(_walk_articles(el, divisions[-1][0] if divisions else _NO_CHAPTER))
+            release_element(el)
+        else:  # CONSID
+            recital = _parse_recital(el)
+            if recital is not None:
+                recitals.append(recital)
+            if not article_depth:
+                release_element(el)
+
+    log.info("Parsed %d articles", len(articles))
     log.info("Parsed %d recitals", len(recitals))
-    return recitals
+    return articles, recitals
 
 
 def parse_annex(xml_path: Path) -> Result[Annex]:
-    """Parse a single ANNEX file."""
+    """Parse a single ANNEX file.
+
+    Streams the file and only materializes the top-level TITLE and CONTENTS
+    subtrees, clearing each once it has been converted.
+    """
+    ti = sti = content = ""
+    seen: set[str] = set()
     try:
-        tree = etree.parse(str(xml_path))  # noqa: S320
+        for _, el in etree.iterparse(  # noqa: S320
+            str(xml_path), events=("end",), tag=("TITLE", "CONTENTS"), **ITERPARSE_OPTS,
+        ):
+            parent = el.getparent()
+            # Only direct children of the ANNEX root; nested TITLEs (GR.SEQ)
+            # belong to CONTENTS and must survive until it is converted.
+            if parent is None or parent.getparent() is not None or el.tag in seen:
+                continue
+            seen.add(el.tag)
+            if el.tag == "TITLE":
+                ti = element_text(_child(el, "TI"))
+                sti = element_text(_child(el, "STI"))
+            else:
+                content = _element_to_text(el)
+            el.clear()
     except etree.XMLSyntaxError as exc:
         return Fail(error=f"Annex XML parse error: {exc}", context=str(xml_path))
 
-    root = tree.getroot()
-    ti = _text(root.find("TITLE/TI"))
-    sti = _text(root.find("TITLE/STI"))
     title = f"{ti} — {sti}" if sti else ti
 
     # Extract annex number from title (e.g., "ANNEX III" → "III")
     number = ti.replace("ANNEX", "").strip() if "ANNEX" in ti else ti
 
-    contents_el = root.find("CONTENTS")
-    content = _element_to_text(contents_el) if contents_el is not None else ""
-
     return Ok(data=Annex(number=number, title=title, content=content))
 
 
+def _parse_annexes(annex_files: list[Path]) -> list[Result[Annex]]:
+    """Parse annex files in parallel; each file is independent CPU-bound work."""
+    workers = min(len(annex_files), os.cpu_count() or 1)
+    if workers < 2:
+        return [parse_annex(path) for path in annex_files]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_annex, annex_files))
+
+
 def parse_document(source_dir: Path) -> Result[ParsedDocument]:
     """Parse the complete Formex document from extracted XML files."""
     doc = ParsedDocument()
 
-    # Main ACT file — matches both Formex naming conventions:
-    #   AI Act:  *.000101.fmx.xml
-    #   GDPR:    *.01000101.xml
-    act_files = sorted(
-        f for f in source_dir.glob("*.xml")
-        if "0101" in f.name and ".doc." not in f.name and ".toc." not in f.name
-    )
+    act_files, annex_files = split_source_files(source_dir)
     if not act_files:
         return Fail(error=f"No main ACT file found in {source_dir}")
 
     act_path = act_files[0]
     try:
-        tree = etree.parse(str(act_path))  # noqa: S320
+        doc.articles, doc.recitals = _stream_act(act_path)
     except etree.XMLSyntaxError as exc:
         return Fail(error=f"ACT XML parse error: {exc}", context=str(act_path))
 
-    root = tree.getroot()
-    doc.articles = parse_articles(root)
-    doc.recitals = parse_recitals(root)
-
-    # Annex files — any XML that is not the main ACT, toc, or doc file
-    act_names = {f.name for f in act_files}
-    annex_files = sorted(
-        f for f in source_dir.glob("*.xml")
-        if ".toc." not in f.name
-        and ".doc." not in f.name
-        and f.name not in act_names
-    )
-    for annex_path in annex_files:
-        result = parse_annex(annex_path)
+    for annex_path, result in zip(annex_files, _parse_annexes(annex_files)):
         if result.ok:
             doc.annexes.append(result.data)
         else:
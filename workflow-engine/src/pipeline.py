@@ -51,10 +51,13 @@ def _source_dict(config: PipelineConfig) -> dict[str, str]:
     return asdict(config.source)
 
 
-def _run_sparql(config: PipelineConfig, summary: PipelineSummary) -> Result[dict[str, Any]]:
+def _run_sparql(
+    config: PipelineConfig,
+    source: dict[str, str],
+    summary: PipelineSummary,
+) -> Result[dict[str, Any]]:
     """Execute all SPARQL workflow steps, building up context."""
     context: dict[str, Any] = {}
-    source = _source_dict(config)
     counter = summary.counter("sparql")
 
     for step in config.sparql.steps:
@@ -98,12 +101,12 @@ def _run_sparql(config: PipelineConfig, summary: PipelineSummary) -> Result[dict
 def _run_fetch(
     config: PipelineConfig,
     context: dict[str, Any],
+    source: dict[str, str],
     tmp_dir: Path,
     summary: PipelineSummary,
 ) -> Result[Path]:
     """Execute the fetch workflow step."""
     counter = summary.counter("fetch")
-    source = _source_dict(config)
 
     result = fetch_document(config.fetch, context, source, tmp_dir)
     if result.ok:
@@ -122,9 +125,10 @@ def run_pipeline(config: PipelineConfig, output_dir: Path) -> Result[dict[str, A
     """
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     summary = PipelineSummary()
+    source = _source_dict(config)
 
     # 1. SPARQL
-    sparql_result = _run_sparql(config, summary)
+    sparql_result = _run_sparql(config, source, summary)
     if not sparql_result.ok:
         log.error("SPARQL phase failed: %s", sparql_result.error)
         log.info(summary.report())
@@ -132,7 +136,7 @@ def run_pipeline(config: PipelineConfig, output_dir: Path) -> Result[dict[str, A
 
     context = sparql_result.data
     context["_timestamp"] = timestamp
-    context["_source"] = _source_dict(config)
+    context["_source"] = source
 
     # Temp dir for fetch + parse (cleaned up after convert)
     tmp_dir = Path(tempfile.mkdtemp(prefix="corpus-builder-"))
@@ -140,7 +144,7 @@ def run_pipeline(config: PipelineConfig, output_dir: Path) -> Result[dict[str, A
 
     try:
         # 2. Fetch
-        fetch_result = _run_fetch(config, context, tmp_dir, summary)
+        fetch_result = _run_fetch(config, context, source, tmp_dir, summary)
         if not fetch_result.ok:
             log.error("Fetch phase failed: %s", fetch_result.error)
             log.info(summary.report())
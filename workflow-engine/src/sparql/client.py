@@ -18,14 +18,13 @@ No domain logic — pure transport layer.
 
 from __future__ import annotations
 
-import json
 import ssl
-import urllib.error
 import urllib.parse
-import urllib.request
 from typing import Any
 
 import certifi
+import orjson
+import urllib3
 
 from src.logger import get_logger
 from src.result import Fail, Ok, Result
@@ -36,6 +35,12 @@ Binding = dict[str, dict[str, str]]
 
 _ssl_ctx = ssl.create_default_context(cafile=certifi.where())
 
+# Shared pool: every step's query reuses the endpoint's TCP/TLS connection
+_http = urllib3.PoolManager(maxsize=1, ssl_context=_ssl_ctx)
+
+# Same policy as urlopen: no retries, follow up to 10 redirects
+_NO_RETRY = urllib3.Retry(connect=0, read=0, other=0, redirect=10)
+
 
 def execute_query(
     endpoint: str,
@@ -45,31 +50,39 @@ def execute_query(
     """POST a SPARQL query and return the parsed result bindings."""
     encoded_body = urllib.parse.urlencode({"query": query}).encode("utf-8")
 
-    req = urllib.request.Request(
-        endpoint,
-        data=encoded_body,
-        headers={
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/sparql-results+json",
-        },
-        method="POST",
-    )
-
     log.info("SPARQL query → %s (%d bytes)", endpoint, len(encoded_body))
 
     try:
-        with urllib.request.urlopen(req, timeout=timeout, context=_ssl_ctx) as resp:
-            raw: dict[str, Any] = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace")[:500]
-        return Fail(
-            error=f"SPARQL HTTP {exc.code}: {exc.reason}",
-            context=body,
+        resp = _http.request(
+            "POST", endpoint,
+            body=encoded_body,
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Accept": "application/sparql-results+json",
+            },
+            retries=_NO_RETRY,
+            timeout=timeout,
         )
-    except urllib.error.URLError as exc:
-        return Fail(error=f"SPARQL connection error: {exc.reason}")
-    except TimeoutError:
+    except urllib3.exceptions.MaxRetryError as exc:
+        reason = exc.reason
+        # NewConnectionError subclasses ConnectTimeoutError for legacy reasons
+        if isinstance(reason, urllib3.exceptions.TimeoutError) and not isinstance(
+            reason, urllib3.exceptions.NewConnectionError,
+        ):
+            return Fail(error=f"SPARQL timeout after {timeout}s")
+        return Fail(error=f"SPARQL connection error: {reason}")
+    except urllib3.exceptions.TimeoutError:
         return Fail(error=f"SPARQL timeout after {timeout}s")
+    except urllib3.exceptions.HTTPError as exc:
+        return Fail(error=f"SPARQL connection error: {exc}")
+
+    if not 200 <= resp.status < 300:
+        return Fail(
+            error=f"SPARQL HTTP {resp.status}: {resp.reason}",
+            context=resp.data.decode("utf-8", errors="replace")[:500],
+        )
+
+    raw: dict[str, Any] = orjson.loads(resp.data)
 
     bindings: list[Binding] = raw.get("results", {}).get("bindings", [])
     log.info("SPARQL returned %d bindings", len(bindings))
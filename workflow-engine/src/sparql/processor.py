@@ -18,6 +18,8 @@ No domain knowledge — all logic lives in data.yaml scripts.
 
 from __future__ import annotations
 
+from functools import lru_cache, partial
+from types import CodeType
 from typing import Any
 
 from src.logger import get_logger
@@ -63,6 +65,18 @@ _SAFE_BUILTINS: dict[str, Any] = {
 }
 
 
+def _column(bindings: list[dict[str, Any]], name: str) -> list[str]:
+    """Values of one SELECT variable per row; "" where it is unbound (OPTIONAL)."""
+    return [row[name]["value"] if name in row else "" for row in bindings]
+
+
+@lru_cache(maxsize=256)
+def _compile_script(script: str) -> CodeType:
+    """Compile a data.yaml script once; steps rerun the same source."""
+    # "<string>" is what exec(str) reports, so error messages stay the same
+    return compile(script, "<string>", "exec")
+
+
 def execute_script(
     script: str,
     bindings: list[dict[str, Any]],
@@ -76,6 +90,7 @@ def execute_script(
         bindings — raw SPARQL JSON result bindings
         context  — accumulated outputs from previous steps
         source   — source config dict (celex, language, ...)
+        column   — column(name) → list of that variable's values, one per row
 
     The script must set an `output` variable. That value is returned.
     """
@@ -83,11 +98,13 @@ def execute_script(
         "bindings": bindings,
         "context": context,
         "source": source,
+        "column": partial(_column, bindings),
         "output": None,
     }
 
     try:
-        exec(script, {"__builtins__": _SAFE_BUILTINS}, namespace)  # noqa: S102
+        # Fresh globals per run: a script's `global` writes must not leak
+        exec(_compile_script(script), {"__builtins__": _SAFE_BUILTINS}, namespace)  # noqa: S102
     except Exception as exc:
         return Fail(
             error=f"Script error in step '{step_name}': {type(exc).__name__}: {exc}",
@@ -18,18 +18,40 @@ Pure string interpolation — no SPARQL knowledge.
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 from src.config import PipelineConfig, SparqlStep
 from src.logger import get_logger
 
 log = get_logger(__name__)
 
+_VAR_RE = re.compile(r"\{\{([A-Za-z_]\w*)}}")
+
+
+class _Variables(dict[str, str]):
+    """format_map mapping that leaves unknown {{key}} placeholders untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return "{{" + key + "}}"
+
+
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> str:
+    """Turn a SPARQL template into a str.format string.
+
+    Only ``{{name}}`` becomes a field; SPARQL's own braces are escaped.
+    """
+    parts = _VAR_RE.split(template)
+    return "".join(
+        f"{{{part}}}" if i % 2 else part.replace("{", "{{").replace("}", "}}")
+        for i, part in enumerate(parts)
+    )
+
 
 def render_template(template: str, variables: dict[str, str]) -> str:
     """Replace all {{key}} placeholders in template with variable values."""
-    rendered = template
-    for key, value in variables.items():
-        rendered = rendered.replace("{{" + key + "}}", value)
-    return rendered
+    return _compile_template(template).format_map(_Variables(variables))
 
 
 def get_template_variables(config: PipelineConfig) -> dict[str, str]:
@@ -46,4 +68,4 @@ def render_step(step: SparqlStep, config: PipelineConfig) -> str:
     variables = get_template_variables(config)
     rendered = render_template(step.template, variables)
     log.info("Rendered template for step '%s'", step.name)
-    return rendered
\ No newline at end of file
+    return rendered
@@ -26,15 +26,22 @@ Checks:
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import orjson
 from lxml import etree
 
 from src.config import ValidationConfig
 from src.logger import PipelineSummary, get_logger
-from src.parser import Annex, Article, ParsedDocument, Recital, _text
+from src.formex import (
+    ITERPARSE_OPTS,
+    XmlElement,
+    element_text,
+    release_element,
+    split_source_files,
+)
+from src.parser import Annex, Article, ParsedDocument, Recital
 from src.result import Ok, Result
 
 log = get_logger(__name__)
@@ -43,7 +50,7 @@ log = get_logger(__name__)
 # ── Report Dataclasses ────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemValidation:
     """Validation result for a single article/recital/annex."""
 
@@ -55,7 +62,7 @@ class ItemValidation:
     warnings: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeterministicResult:
     """Results of all deterministic checks."""
 
@@ -71,7 +78,7 @@ class DeterministicResult:
     low_coverage: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Complete validation report."""
 
@@ -86,6 +93,20 @@ class ValidationReport:
 # ── Source Text Extraction ────────────────────────────────────
 
 
+def _record_source_text(element: XmlElement, source_map: dict[str, str]) -> None:
+    """Record the raw text of an ACT ARTICLE (with quoted ones) or CONSID."""
+    if element.tag == "CONSID":
+        np = element.find("NP")
+        if np is not None:
+            number = element_text(np.find("NO.P")).strip("()")
+            source_map[f"recital:{number}"] = element_text(element)
+        return
+    # Pre-order, so duplicate numbers resolve as root.iter("ARTICLE") would
+    for art_el in element.iter("ARTICLE"):
+        number = element_text(art_el.find("TI.ART")).replace("Article", "").strip()
+        source_map[f"article:{number}"] = element_text(art_el)
+
+
 def _build_source_text_map(source_dir: Path) -> dict[str, str]:
     """Re-parse XML files to extract raw text per element.
 
@@ -93,48 +114,51 @@ def _build_source_text_map(source_dir: Path) -> dict[str, str]:
     """
     source_map: dict[str, str] = {}
 
-    act_files = sorted(
-        f for f in source_dir.glob("*.xml")
-        if "0101" in f.name and ".doc." not in f.name and ".toc." not in f.name
-    )
+    act_files, annex_files = split_source_files(source_dir)
     if not act_files:
         return source_map
 
+    # One streaming pass; each top-level ARTICLE/CONSID is released once
+    # read. _text includes the tail, which is only complete once a later
+    # event arrives, so every finished element is recorded one event late.
+    article_depth = 0
+    pending: XmlElement | None = None
+    release = False
     try:
-        tree = etree.parse(str(act_files[0]))  # noqa: S320
+        for event, el in etree.iterparse(  # noqa: S320
+            str(act_files[0]),
+            events=("start", "end"),
+            tag=("ARTICLE", "CONSID"),
+            **ITERPARSE_OPTS,
+        ):
+            if pending is not None:
+                _record_source_text(pending, source_map)
+                if release:
+                    release_element(pending)
+                pending = None
+            if el.tag == "ARTICLE":
+                if event == "start":
+                    article_depth += 1
+                    continue
+                article_depth -= 1
+                if not article_depth:  # quoted ARTICLEs go with their outermost one
+                    pending, release = el, True
+            elif event == "end":
+                pending, release = el, not article_depth
     except etree.XMLSyntaxError:
-        return source_map
-
-    root = tree.getroot()
+        return {}
+    if pending is not None:
+        _record_source_text(pending, source_map)
 
-    for art_el in root.iter("ARTICLE"):
-        number = _text(art_el.find("TI.ART")).replace("Article", "").strip()
-        source_map[f"article:{number}"] = _text(art_el)
-
-    for consid in root.iter("CONSID"):
-        np = consid.find("NP")
-        if np is None:
-            continue
-        number = _text(np.find("NO.P")).strip("()")
-        source_map[f"recital:{number}"] = _text(consid)
-
-    act_names = {f.name for f in act_files}
-    annex_files = sorted(
-        f
-        for f in source_dir.glob("*.xml")
-        if ".toc." not in f.name
-        and ".doc." not in f.name
-        and f.name not in act_names
-    )
     for annex_path in annex_files:
         try:
             atree = etree.parse(str(annex_path))  # noqa: S320
         except etree.XMLSyntaxError:
             continue
         aroot = atree.getroot()
-        ti = _text(aroot.find("TITLE/TI"))
+        ti = element_text(aroot.find("TITLE/TI"))
         number = ti.replace("ANNEX", "").strip() if "ANNEX" in ti else ti
-        source_map[f"annex:{number}"] = _text(aroot)
+        source_map[f"annex:{number}"] = element_text(aroot)
 
     return source_map
 
@@ -145,11 +169,8 @@ def _build_source_text_map(source_dir: Path) -> dict[str, str]:
 def _get_parsed_text(item: Article | Recital | Annex) -> str:
     """Extract the full text content from a parsed item."""
     if isinstance(item, Article):
-        parts: list[str] = []
-        for p in item.paragraphs:
-            if p.text:
-                parts.append(p.text)
-        return "\n".join(parts)
+        # A list, not a generator: str.join would materialize one anyway
+        return "\n".join([p.text for p in item.paragraphs if p.text])
     if isinstance(item, Recital):
         return item.text
     if isinstance(item, Annex):
@@ -170,9 +191,9 @@ def _check_sequential_numbering(articles: list[Article]) -> list[str]:
         except ValueError:
             continue
     numbers.sort()
-    for i in range(1, len(numbers)):
-        if numbers[i] != numbers[i - 1] + 1:
-            gaps.append(f"article: gap between {numbers[i - 1]} and {numbers[i]}")
+    for prev, cur in zip(numbers, numbers[1:]):
+        if cur != prev + 1:
+            gaps.append(f"article: gap between {prev} and {cur}")
     return gaps
 
 
@@ -205,11 +226,12 @@ def _run_deterministic(
     for x in doc.annexes:
         all_parsed.append(("annex", x.number, x))
 
-    for item_type, item_id, item in all_parsed:
+    keys = [f"{item_type}:{item_id}" for item_type, item_id, _ in all_parsed]
+    source_lens = [len(source_map.get(key, "")) for key in keys]
+
+    rows = zip(all_parsed, keys, source_lens)
+    for (item_type, item_id, item), source_key, source_len in rows:
         parsed_text = _get_parsed_text(item)
-        source_key = f"{item_type}:{item_id}"
-        source_text = source_map.get(source_key, "")
-        source_len = len(source_text)
         parsed_len = len(parsed_text)
 
         if not parsed_text.strip():
@@ -285,10 +307,8 @@ def _save_report(report: ValidationReport, output_dir: Path) -> Path:
     """Save validation report as JSON alongside the corpus directory."""
     report_path = output_dir.parent / "validation-report.json"
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(
-        json.dumps(asdict(report), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    # orjson serializes the dataclasses natively and writes UTF-8 as-is
+    report_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     return report_path
 
 